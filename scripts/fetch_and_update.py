@@ -1,12 +1,27 @@
+import asyncio
+import gzip
+import hashlib
 import os
 import json
-from datetime import datetime
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from io import BytesIO
 import uuid
 
-import feedparser
-import requests
+import httpx
+from lxml import etree
+from selectolax.parser import HTMLParser
 from textwrap import dedent
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ------------- CONFIG -------------
 
 RSS_FEEDS = [
@@ -24,73 +39,311 @@ RSS_FEEDS = [
 # Keep only articles on/after this date
 CUTOFF_DATE_STR = "2000-01-01"  # you can tighten later if you want
 CUTOFF_DATE = datetime.fromisoformat(CUTOFF_DATE_STR)
+CUTOFF_DATE_UTC = CUTOFF_DATE.replace(tzinfo=timezone.utc)
 
+# Append-only article store + small conditional-GET state; data.json is
+# rebuilt from these each run because the site fetches it directly.
+ARTICLES_PATH = "articles.jsonl"
+STATE_PATH = "state.json"
 DATA_PATH = "data.json"
 
+# On-disk cache of fetched article HTML, keyed by article id; lets retries
+# (and offline prompt tuning) skip the network entirely
+CACHE_DIR = "cache"
+
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 if not OPENAI_API_KEY:
     raise SystemExit("OPENAI_API_KEY not set in environment.")
 
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"  # [Speculation: ensure this matches your OpenAI endpoint]
 
+# How many articles to fetch + score at the same time
+MAX_CONCURRENT_ARTICLES = 8
+
+# How many articles to extract per OpenAI request; most per-call wall time
+# is fixed overhead, so batching divides the request count
+OPENAI_BATCH_SIZE = 5
+
+# Cap on extracted article text sent to OpenAI
+MAX_ARTICLE_CHARS = 8000
+
+# Shared pool limits: keep connections alive for the whole run so TLS
+# handshakes are paid once per host, not once per article.
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
 # ------------- HELPERS -------------
 
-def load_existing_data():
+def load_articles():
+    if os.path.exists(ARTICLES_PATH):
+        articles = []
+        with open(ARTICLES_PATH, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    if orjson is not None:
+                        articles.append(orjson.loads(line))
+                    else:
+                        articles.append(json.loads(line))
+                except ValueError:
+                    continue
+        return articles
+
+    # One-time migration from the old single-file data.json layout
     if os.path.exists(DATA_PATH):
-        with open(DATA_PATH, "r", encoding="utf-8") as f:
+        with open(DATA_PATH, "rb") as f:
             try:
+                if orjson is not None:
+                    return orjson.loads(f.read()).get("articles", [])
+                return json.load(f).get("articles", [])
+            except ValueError:
+                return []
+    return []
+
+
+def append_articles(articles):
+    if not articles:
+        return
+    with open(ARTICLES_PATH, "ab") as f:
+        for art in articles:
+            if orjson is not None:
+                f.write(orjson.dumps(art) + b"\n")
+            else:
+                f.write(json.dumps(art, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+def load_state():
+    if os.path.exists(STATE_PATH):
+        with open(STATE_PATH, "rb") as f:
+            try:
+                if orjson is not None:
+                    return orjson.loads(f.read())
                 return json.load(f)
-            except json.JSONDecodeError:
-                return {"articles": []}
+            except ValueError:
+                return {}
+    return {}
+
+
+def save_state(state):
+    if orjson is not None:
+        with open(STATE_PATH, "wb") as f:
+            f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
     else:
-        return {"articles": []}
+        with open(STATE_PATH, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
 
 
-def save_data(data):
-    with open(DATA_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def save_data(data, pretty=False):
+    # Compact by default: data.json is fetched by the site and committed
+    # daily, so indentation only inflates file size and git churn. Pass
+    # --pretty on the command line to get the old human-readable dump.
+    if orjson is not None:
+        with open(DATA_PATH, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(DATA_PATH, "w", encoding="utf-8") as f:
+            if pretty:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            else:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
 
 
+# Feeds repeat the same timestamp strings a lot (especially after dates are
+# normalized to day granularity), so cache parsed results. Inputs are strings
+# and outputs immutable datetimes, which makes caching safe.
+@lru_cache(maxsize=4096)
 def parse_date(date_str):
     if not date_str:
         return None
+    # Cheap prechecks dispatch to the right parser directly: RFC-2822 dates
+    # look like "Tue, 26 Aug 2025 ...", ISO-8601 starts with a 4-digit year.
+    # Feed dates are almost always RFC-2822, so blindly trying fromisoformat
+    # first raised (and unwound) an exception per entry. Anything neither
+    # precheck claims (e.g. day-name-less RFC-2822) hits the fallback below.
     try:
-        return datetime.fromisoformat(date_str)
-    except Exception:
-        try:
-            from email.utils import parsedate_to_datetime
+        if date_str[3:4] == ",":
             return parsedate_to_datetime(date_str)
-        except Exception:
-            return None
+        if date_str[:4].isdigit():
+            return datetime.fromisoformat(date_str)
+    except Exception:
+        pass
+    try:
+        return parsedate_to_datetime(date_str)
+    except Exception:
+        return None
+
+
+# uuid5 is SHA-1 over namespace bytes + name; hashing directly skips the
+# UUID object construction. The first 8 hex chars are untouched by the
+# version/variant bits, so existing art_ ids stay stable.
+_NS_BYTES = uuid.NAMESPACE_URL.bytes
 
 
 def make_article_id(url, published_dt):
+    # Ids have always been derived from the tz-naive isoformat string; keep
+    # that derivation stable so stored articles are not re-scored.
+    if published_dt is not None and published_dt.tzinfo is not None:
+        published_dt = published_dt.replace(tzinfo=None)
     base = (url or "") + (published_dt.isoformat() if published_dt else "")
-    return "art_" + uuid.uuid5(uuid.NAMESPACE_URL, base).hex[:8]
+    return "art_" + hashlib.sha1(_NS_BYTES + base.encode("utf-8")).hexdigest()[:8]
+
+
+def feed_is_newest_first(entries):
+    """
+    Best-effort check that a feed lists entries newest-first, by comparing
+    the first two parsable entry dates. parse_date is cached, so the main
+    loop's re-parse of these entries is free.
+    """
+    dates = []
+    for entry in entries:
+        dt = parse_date(entry.get("published", "") or entry.get("updated", ""))
+        if dt:
+            dates.append(dt)
+            if len(dates) == 2:
+                first, second = dates
+                if (first.tzinfo is None) != (second.tzinfo is None):
+                    return False
+                return first >= second
+    return False
+
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+
+def parse_feed_xml(content):
+    """
+    Minimal RSS 2.0 / Atom extractor. The pipeline only reads the feed title
+    plus each entry's title, link, and dates, so pull exactly those fields
+    with lxml's C parser instead of materializing feedparser's full
+    sanitized tree.
+    """
+    feed_title = ""
+    entries = []
+    try:
+        for _, elem in etree.iterparse(
+            BytesIO(content),
+            events=("end",),
+            tag=("item", f"{_ATOM_NS}entry", "channel", f"{_ATOM_NS}feed"),
+            recover=True,
+            resolve_entities=False,
+        ):
+            tag = elem.tag
+            if tag == "item":
+                entries.append({
+                    "title": (elem.findtext("title") or "").strip(),
+                    "link": (elem.findtext("link") or "").strip(),
+                    "published": (elem.findtext("pubDate") or elem.findtext(_DC_DATE) or "").strip(),
+                    "updated": "",
+                })
+                elem.clear()
+            elif tag == f"{_ATOM_NS}entry":
+                link_el = elem.find(f"{_ATOM_NS}link[@rel='alternate']")
+                if link_el is None:
+                    link_el = elem.find(f"{_ATOM_NS}link")
+                entries.append({
+                    "title": (elem.findtext(f"{_ATOM_NS}title") or "").strip(),
+                    "link": (link_el.get("href", "") if link_el is not None else "").strip(),
+                    "published": (elem.findtext(f"{_ATOM_NS}published") or "").strip(),
+                    "updated": (elem.findtext(f"{_ATOM_NS}updated") or "").strip(),
+                })
+                elem.clear()
+            elif tag == "channel":
+                feed_title = (elem.findtext("title") or "").strip() or feed_title
+            else:  # Atom <feed>
+                feed_title = (elem.findtext(f"{_ATOM_NS}title") or "").strip() or feed_title
+    except etree.XMLSyntaxError:
+        pass
+    return feed_title, entries
+
+
+def fetch_feed(feed_url, prev_state, client):
+    print(f"Fetching feed: {feed_url}")
+
+    headers = {}
+    if prev_state.get("etag"):
+        headers["If-None-Match"] = prev_state["etag"]
+    if prev_state.get("modified"):
+        headers["If-Modified-Since"] = prev_state["modified"]
+
+    empty = {"status": None, "etag": None, "modified": None,
+             "feed_title": "", "entries": []}
+    try:
+        resp = client.get(feed_url, headers=headers)
+    except Exception as e:
+        print(f"Failed to fetch feed {feed_url}: {e}")
+        return feed_url, empty
+
+    if resp.status_code == 304:
+        return feed_url, dict(empty, status=304)
+
+    feed_title, entries = parse_feed_xml(resp.content)
+    return feed_url, {
+        "status": resp.status_code,
+        "etag": resp.headers.get("ETag"),
+        "modified": resp.headers.get("Last-Modified"),
+        "feed_title": feed_title,
+        "entries": entries,
+    }
 
 
-def fetch_article_body(url):
+def extract_article_text(html):
+    """Reduce a full HTML page to the article's plain text."""
+    tree = HTMLParser(html)
+    node = tree.css_first("article, main, body")
+    if node is None:
+        return html[:MAX_ARTICLE_CHARS]
+    return node.text(separator=" ", strip=True)[:MAX_ARTICLE_CHARS]
+
+
+async def fetch_article_body(article_id, url, client):
     if not url:
         return ""
+
+    # Cache the raw HTML (not the extracted text) so replays still go
+    # through extract_article_text as it evolves.
+    path = os.path.join(CACHE_DIR, f"{article_id}.html.gz")
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                html = gzip.decompress(f.read()).decode("utf-8", "replace")
+            return extract_article_text(html)
+        except (OSError, EOFError, zlib.error):
+            # Truncated or corrupt cache entry: fall through to a re-fetch,
+            # which overwrites it.
+            pass
+
     try:
-        resp = requests.get(url, timeout=20)
+        resp = await client.get(url, timeout=20)
         resp.raise_for_status()
-        return resp.text
     except Exception:
         return ""
 
+    # Write via a temp file + rename so a run killed mid-write can't leave
+    # a truncated .gz behind.
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, "wb", compresslevel=3) as f:
+            f.write(resp.content)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
-def call_openai_for_article(article_meta, article_text):
-    """
-    Ask the model to return a FULL article object in your schema.
-    """
+    return extract_article_text(resp.text)
 
-    prompt = dedent(f"""
+
+# The instruction + schema part of the prompt never changes per article, so
+# dedent it once at import time instead of re-running dedent on every call.
+_PROMPT_PREFIX = dedent("""
     You are an information extraction engine for CPG launches and sampling campaigns.
 
-    Output ONLY a JSON object with this exact structure:
+    You will be given one or more articles. Output ONLY a JSON object of the form
+    {"articles": [...]} containing exactly one object per article, in the same
+    order the articles are given below, where each object has this exact structure:
 
-    {{
+    {
       "id": string,
       "title": string,
       "url": string,
@@ -102,7 +355,7 @@ def call_openai_for_article(article_meta, article_text):
       "demo_tags": string[],
       "psych_tags": string[],
       "stakeholders": [
-        {{
+        {
           "full_name": string,
           "title": string,
           "company_name": string,
@@ -111,17 +364,17 @@ def call_openai_for_article(article_meta, article_text):
           "email": string,
           "email_status": string,
           "email_confidence": number
-        }}
+        }
       ],
       "outreach_templates": [
-        {{
+        {
           "stakeholder_full_name": string,
           "email_subject": string,
           "email_body": string,
           "linkedin_message": string
-        }}
+        }
       ]
-    }}
+    }
 
     Constraints:
     - Use the article metadata provided below for "title", "url", "source", and "published_at" when possible.
@@ -132,16 +385,29 @@ def call_openai_for_article(article_meta, article_text):
     - For "stakeholders", include only people who appear to be marketing / brand / shopper / experiential / sampling decision-makers or clearly listed PR contacts.
     - Leave "email" blank "" if the article does not specify an email address.
     - Output MUST be valid JSON. Do not include any explanation or text outside the JSON.
+    """)
 
-    Article metadata:
-    - Title: {article_meta.get("title", "")}
-    - URL: {article_meta.get("link", "")}
-    - Source: {article_meta.get("source", "")}
-    - Published date: {article_meta.get("published", "")}
 
-    Article text (may include HTML):
-    {article_text}
-    """)
+async def call_openai_for_batch(items, client):
+    """
+    Ask the model to return FULL article objects (in your schema) for a batch
+    of (article_meta, article_text) pairs, one object per article, in order.
+    """
+
+    sections = []
+    for i, (article_meta, article_text) in enumerate(items, 1):
+        sections.append(
+            f"Article {i} metadata:\n"
+            f"- Title: {article_meta.get('title', '')}\n"
+            f"- URL: {article_meta.get('link', '')}\n"
+            f"- Source: {article_meta.get('source', '')}\n"
+            f"- Published date: {article_meta.get('published', '')}\n"
+            f"\n"
+            f"Article {i} text:\n"
+            f"{article_text}\n"
+        )
+
+    prompt = f"{_PROMPT_PREFIX}\n" + "\n".join(sections)
 
     headers = {
         "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -153,127 +419,221 @@ def call_openai_for_article(article_meta, article_text):
         "messages": [
             {"role": "user", "content": prompt}
         ],
-        "temperature": 0
+        "temperature": 0,
+        "response_format": {"type": "json_object"}
     }
 
-    resp = requests.post(OPENAI_API_URL, headers=headers, json=body, timeout=120)
+    resp = await client.post(OPENAI_API_URL, headers=headers, json=body, timeout=120)
     resp.raise_for_status()
     data = resp.json()
+    # JSON mode guarantees a bare JSON object, so no fence stripping or
+    # brace scanning is needed.
     content = data["choices"][0]["message"]["content"]
 
-    # Clean up possible ```json fences
-    content = content.strip()
-    if content.startswith("```"):
-        lines = content.splitlines()
-        if lines and lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].startswith("```"):
-            lines = lines[:-1]
-        content = "\n".join(lines).strip()
-
-    # Extract JSON between first { and last }
-    start = content.find("{")
-    end = content.rfind("}")
-    if start == -1 or end == -1:
-        raise RuntimeError(f"Model output did not contain JSON braces: {content}")
-
-    json_text = content[start:end + 1]
-
     try:
-        return json.loads(json_text)
+        parsed = json.loads(content)
     except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse model output as JSON: {json_text}") from e
+        raise RuntimeError(f"Failed to parse model output as JSON: {content}") from e
 
+    extracted = parsed.get("articles")
+    if not isinstance(extracted, list):
+        raise RuntimeError(f"Model output missing \"articles\" array: {content}")
+    return extracted
 
-def main():
-    data = load_existing_data()
-    existing_articles = data.get("articles", [])
 
-    # Index existing by id
-    id_to_article = {a.get("id"): a for a in existing_articles if a.get("id")}
+async def process_batch(batch, client_http, client_openai, sem):
+    async def fetch_one(article_id, article_meta):
+        async with sem:
+            return await fetch_article_body(article_id, article_meta["link"], client_http)
+
+    bodies = await asyncio.gather(
+        *(fetch_one(article_id, meta) for article_id, meta in batch)
+    )
 
-    new_articles = []
+    # Drop entries whose body fetch failed
+    items = [
+        (article_id, article_meta, text)
+        for (article_id, article_meta), text in zip(batch, bodies)
+        if text
+    ]
+    if not items:
+        return []
+
+    try:
+        async with sem:
+            extracted = await call_openai_for_batch(
+                [(meta, text) for _, meta, text in items], client_openai
+            )
+    except Exception as e:
+        print(f"Skipping batch due to OpenAI error: {e}")
+        return []
+
+    # The positional zip below mis-attributes every extraction after a gap
+    # if the model returns the wrong number of objects, so treat a length
+    # mismatch as a batch failure: the ids stay unstored and the whole
+    # batch is retried next run.
+    if len(extracted) != len(items):
+        print(
+            f"Skipping batch: model returned {len(extracted)} article object(s) "
+            f"for {len(items)} article(s)"
+        )
+        return []
+
+    articles = []
+    for (article_id, article_meta, _), article_json in zip(items, extracted):
+        if not isinstance(article_json, dict):
+            continue
+
+        # Ensure core fields are present / overridden by meta
+        article_json.setdefault("id", article_id)
+        article_json["id"] = article_id
+        article_json.setdefault("url", article_meta["link"])
+        article_json.setdefault("source", article_meta["source"])
+        article_json.setdefault("published_at", article_meta["published"])
+        article_json.setdefault("summary", "")
+        article_json.setdefault("categories", [])
+        article_json.setdefault("campaign_types", [])
+        article_json.setdefault("demo_tags", [])
+        article_json.setdefault("psych_tags", [])
+        article_json.setdefault("stakeholders", [])
+        article_json.setdefault("outreach_templates", [])
+
+        articles.append(article_json)
+
+    return articles
+
+
+async def process_candidates(candidates):
+    sem = asyncio.Semaphore(MAX_CONCURRENT_ARTICLES)
+    batches = [
+        candidates[i:i + OPENAI_BATCH_SIZE]
+        for i in range(0, len(candidates), OPENAI_BATCH_SIZE)
+    ]
+    async with httpx.AsyncClient(limits=HTTP_LIMITS, follow_redirects=True) as client_http, \
+            httpx.AsyncClient(http2=True, limits=HTTP_LIMITS) as client_openai:
+        results = await asyncio.gather(
+            *(process_batch(batch, client_http, client_openai, sem) for batch in batches)
+        )
+    return [article for batch_articles in results for article in batch_articles]
 
-    for feed_url in RSS_FEEDS:
-        print(f"Fetching feed: {feed_url}")
-        parsed = feedparser.parse(feed_url)
 
-        for entry in parsed.entries:
+def main():
+    seeding_store = not os.path.exists(ARTICLES_PATH)
+    existing_articles = load_articles()
+
+    # Ids already in the store; dedupe only needs membership, not the
+    # article objects themselves
+    seen_ids = {a["id"] for a in existing_articles if a.get("id")}
+
+    # Conditional-GET state (etag / last-modified) per feed URL
+    state = load_state()
+    feed_state = state.get("feeds", {})
+
+    # Feed fetching is network-bound, so grab all feeds concurrently and
+    # process the parsed results serially afterwards.
+    with httpx.Client(limits=HTTP_LIMITS, follow_redirects=True, timeout=20) as feed_client:
+        with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+            fetched_feeds = list(executor.map(
+                fetch_feed,
+                RSS_FEEDS,
+                [feed_state.get(url, {}) for url in RSS_FEEDS],
+                [feed_client] * len(RSS_FEEDS),
+            ))
+
+    # First pass: collect the entries that actually need fetching + scoring.
+    # New conditional-GET validators are held back until the feed's
+    # candidates actually make it into the store; committing them eagerly
+    # would hide failed articles behind a 304 on the next run.
+    candidates = []
+    pending_feed_state = {}
+    feed_candidate_ids = {}
+
+    for feed_url, parsed in fetched_feeds:
+        if parsed["status"] == 304:
+            # Feed unchanged since last run
+            continue
+
+        new_feed_state = {}
+        if parsed["etag"]:
+            new_feed_state["etag"] = parsed["etag"]
+        if parsed["modified"]:
+            new_feed_state["modified"] = parsed["modified"]
+        if new_feed_state:
+            pending_feed_state[feed_url] = new_feed_state
+
+        # On newest-first feeds the first entry older than the cutoff means
+        # everything after it is older too, so we can stop scanning.
+        newest_first = feed_is_newest_first(parsed["entries"])
+
+        for entry in parsed["entries"]:
             title = entry.get("title", "")
             link = entry.get("link", "")
             if not link:
                 continue
 
-            source = parsed.feed.get("title", "") or "Unknown"
+            source = parsed["feed_title"] or "Unknown"
             published_raw = entry.get("published", "") or entry.get("updated", "")
             published_dt = parse_date(published_raw)
             if not published_dt:
                 continue
 
-            # make timezone-naive if needed
-            if published_dt.tzinfo is not None:
-                published_dt = published_dt.replace(tzinfo=None)
-
-            if published_dt < CUTOFF_DATE:
+            # Storage uses date().isoformat(), which has no tz component, so
+            # there is nothing to strip here: aware timestamps compare
+            # against the UTC cutoff, naive ones against the naive cutoff.
+            if published_dt < (CUTOFF_DATE_UTC if published_dt.tzinfo else CUTOFF_DATE):
+                if newest_first:
+                    break
                 continue
 
             article_id = make_article_id(link, published_dt)
-            if article_id in id_to_article:
+            if article_id in seen_ids:
                 # already processed
                 continue
+            seen_ids.add(article_id)
 
-            article_meta = {
+            feed_candidate_ids.setdefault(feed_url, set()).add(article_id)
+            candidates.append((article_id, {
                 "title": title,
                 "link": link,
                 "source": source,
                 "published": published_dt.date().isoformat()
-            }
-
-            body_html = fetch_article_body(link)
-            if not body_html:
-                continue
+            }))
+
+    # Second pass: fetch bodies and call OpenAI concurrently.
+    new_articles = asyncio.run(process_candidates(candidates)) if candidates else []
+
+    # Existing articles were already cutoff-filtered and sorted on previous
+    # runs, so only the new tail needs the check before merging. published_at
+    # is ISO-8601, so lexicographic order is chronological order; the re-sort
+    # of the merged (mostly sorted) list is near-linear.
+    fresh_articles = [
+        art for art in new_articles
+        if art.get("published_at", "") >= CUTOFF_DATE_STR
+    ]
+    filtered = existing_articles + fresh_articles
+    filtered.sort(key=lambda a: a.get("published_at", ""), reverse=True)
 
-            try:
-                article_json = call_openai_for_article(article_meta, body_html)
-            except Exception as e:
-                print(f"Skipping article due to OpenAI error: {e}")
-                continue
+    # Append only the new articles that passed the cutoff (seed the whole
+    # store on first run after migration), then rebuild data.json for the
+    # site. Storing a pre-cutoff article would let it resurface on the next
+    # run, since existing articles are merged in unfiltered.
+    if seeding_store:
+        append_articles(existing_articles + fresh_articles)
+    else:
+        append_articles(fresh_articles)
 
-            # Ensure core fields are present / overridden by meta
-            article_json.setdefault("id", article_id)
-            article_json["id"] = article_id
-            article_json.setdefault("url", link)
-            article_json.setdefault("source", source)
-            article_json.setdefault("published_at", published_dt.date().isoformat())
-            article_json.setdefault("summary", "")
-            article_json.setdefault("categories", [])
-            article_json.setdefault("campaign_types", [])
-            article_json.setdefault("demo_tags", [])
-            article_json.setdefault("psych_tags", [])
-            article_json.setdefault("stakeholders", [])
-            article_json.setdefault("outreach_templates", [])
-
-            id_to_article[article_json["id"]] = article_json
-            new_articles.append(article_json)
-
-    # Rebuild list, keep only articles on/after cutoff, normalize timezone here too
-    all_articles = list(id_to_article.values())
-
-    filtered = []
-    for art in all_articles:
-        pd = parse_date(art.get("published_at", ""))
-
-        # Normalize timezone if present
-        if pd and pd.tzinfo is not None:
-            pd = pd.replace(tzinfo=None)
-
-        if pd and pd >= CUTOFF_DATE:
-            filtered.append(art)
+    # Commit a feed's new validators only once every candidate it produced
+    # was stored; a feed whose articles were skipped (e.g. an OpenAI outage)
+    # keeps its old validators so the entries are re-seen and retried.
+    stored_ids = {a.get("id") for a in fresh_articles}
+    for feed_url, new_feed_state in pending_feed_state.items():
+        if feed_candidate_ids.get(feed_url, set()) <= stored_ids:
+            feed_state[feed_url] = new_feed_state
 
-    filtered.sort(key=lambda a: a.get("published_at", ""), reverse=True)
+    state["feeds"] = feed_state
+    save_state(state)
 
-    data["articles"] = filtered
-    save_data(data)
+    save_data({"articles": filtered}, pretty="--pretty" in sys.argv)
 
     print(f"Updated data.json with {len(new_articles)} new article(s).")
 